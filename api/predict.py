@@ -1,11 +1,14 @@
 # api/predict.py
 from http.server import BaseHTTPRequestHandler
-import json
+import asyncio
 import os
 import sys
-import pandas as pd
+import threading
 import numpy as np
 from datetime import datetime
+from functools import lru_cache
+import orjson
+from cachetools import TTLCache
 
 # Add current path to Python path for local imports
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
@@ -13,280 +16,670 @@ sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 # Try to import model functions - will work if model files are available
 try:
     from model import predict_single_item, load_model_components
+
+    def _predict_valid_item(**inputs):
+        """predict_single_item that raises on an empty result, so it isn't cached"""
+        predicted_price = predict_single_item(**inputs)
+        if not predicted_price:
+            raise ValueError(f"model returned no prediction ({predicted_price!r})")
+        return float(predicted_price)
+
+    # Identical inputs recur across requests (dashboards, polling clients);
+    # lru_cache does not store raised exceptions, so failures are retried
+    _predict_cached = lru_cache(maxsize=4096)(_predict_valid_item)
     MODEL_LOADED = True
     print("✅ Model functions imported successfully")
+
+    # Batch inference is optional; without it each period is predicted separately
+    try:
+        from model import predict_batch
+    except ImportError:
+        predict_batch = None
+
+    # Build the model at import so the first request doesn't pay for it
+    try:
+        load_model_components()
+        print("✅ Model weights preloaded")
+    except Exception as e:
+        print(f"⚠️ Model preload warning: {e}")
 except ImportError as e:
     print(f"⚠️ Model import warning: {e}")
     MODEL_LOADED = False
+    predict_batch = None
+
+# orjson writes bytes directly and formats datetime/numpy values natively
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+
+# Prediction requests are small JSON objects; reject anything unreasonable
+MAX_REQUEST_BODY_SIZE = 1024 * 1024
+
+# String fields every prediction request must provide
+REQUIRED_FIELDS = ("product_type", "tg_code", "country_region", "country", "industry")
+
+# Longest horizon a request may ask for, in months
+MAX_HORIZON_WINDOW = 24
+
+# Period tables for the longest horizon, computed once and sliced per request
+_PERIOD_OFFSETS = np.arange(MAX_HORIZON_WINDOW, dtype=np.int32)
+_PERIOD_YEARS, _PERIOD_MONTHS = np.divmod(_PERIOD_OFFSETS, 12)
+_PERIOD_YEARS += 2024
+_PERIOD_MONTHS += 1
+_PERIOD_NUMBERS = _PERIOD_OFFSETS + 1
+for _table in (_PERIOD_OFFSETS, _PERIOD_YEARS, _PERIOD_MONTHS, _PERIOD_NUMBERS):
+    _table.setflags(write=False)
+del _table
+_PERIOD_DATES = [f"{year}-{month:02d}"
+                 for year, month in zip(_PERIOD_YEARS.tolist(), _PERIOD_MONTHS.tolist())]
+# (period, year, month, date) as plain Python values for building records
+_PERIOD_FIELDS = list(zip(_PERIOD_NUMBERS.tolist(), _PERIOD_YEARS.tolist(),
+                          _PERIOD_MONTHS.tolist(), _PERIOD_DATES))
+
+# Layouts accepted for the "predictions" field of a response
+RESPONSE_FORMATS = ("records", "columnar")
+
+# Trend labels indexed by np.sign(last - first) + 1
+_PRICE_TRENDS = ("decreasing", "stable", "increasing")
+
+# Successful prediction response with its constant fields filled in; the
+# key order here is the order clients see
+_RESPONSE_TEMPLATE = {
+    "success": True,
+    "model_used": "tensorflow" if MODEL_LOADED else "simulation",
+    "horizon_window": None,
+    "total_predictions": None,
+    "successful_predictions": None,
+    "failed_predictions": None,
+    "input_parameters": None,
+    "price_statistics": None,
+    "predictions": None,
+    "timestamp": None
+}
+
+# Add note if using simulation
+if not MODEL_LOADED:
+    _RESPONSE_TEMPLATE["note"] = "Using simulated data. Deploy with model files for real predictions."
+
+# Serialized successful responses, keyed on the request parameters
+RESPONSE_CACHE_SIZE = 1024
+RESPONSE_CACHE_TTL = 60  # seconds
+_RESPONSE_CACHE = TTLCache(maxsize=RESPONSE_CACHE_SIZE, ttl=RESPONSE_CACHE_TTL)
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'POST, OPTIONS, GET',
+    'Access-Control-Allow-Headers': 'Content-Type',
+}
+
+# Health check payload; only the timestamp changes between requests
+HEALTH_INFO = {
+    "status": "healthy",
+    "service": "MPI Price Predictor API",
+    "version": "1.0.0",
+    "model_loaded": MODEL_LOADED,
+    "endpoints": {
+        "GET /": "Health check and API information",
+        "POST /": "Make price predictions",
+        "OPTIONS /": "CORS preflight"
+    },
+    "usage": {
+        "method": "POST",
+        "content_type": "application/json",
+        "required_fields": list(REQUIRED_FIELDS),
+        "optional_fields": {
+            "horizon_window": "Number of months to predict (default: 1)",
+            "response_format": "\"records\" (default) or \"columnar\" predictions layout"
+        }
+    }
+}
+
+# Serialize the invariant part once; the timestamp is appended per request
+_HEALTH_PREFIX = orjson.dumps(HEALTH_INFO, option=JSON_OPTIONS)[:-2] + b',\n  "timestamp": "'
+_HEALTH_SUFFIX = b'"\n}'
+
+def health_response_body():
+    """Build the health check and API information response body"""
+    return _HEALTH_PREFIX + datetime.now().isoformat().encode() + _HEALTH_SUFFIX
+
+def error_response_body(message):
+    """Serialize an error response shared by the Handler and the ASGI app"""
+    return orjson.dumps({
+        "success": False,
+        "error": message,
+        "timestamp": datetime.now()
+    })
 
 class Handler(BaseHTTPRequestHandler):
+    """Serverless (Vercel) entry point built on the stdlib HTTP server"""
+
+    # HTTP/1.1 keeps connections alive; every response sets Content-Length
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY,
+    # Nagle + delayed ACK stall each response on a kept-alive connection
+    disable_nagle_algorithm = True
+
     def do_OPTIONS(self):
         """Handle CORS preflight requests"""
         self.send_response(200)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'POST, OPTIONS, GET')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        for name, value in CORS_HEADERS.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', '0')
         self.end_headers()
 
     def do_GET(self):
         """Health check and API information endpoint"""
-        self.send_response(200)
+        self._send_json(200, health_response_body())
+
+    def do_POST(self):
+        """Handle price prediction requests"""
+        # Read and parse request data before committing to a 200 response
+        # The body is left unread on a bad length, so those responses close
+        # the connection rather than misparse it as the next request
+        try:
+            content_length = int(self.headers.get('Content-Length', '0'))
+        except ValueError:
+            content_length = -1
+        if content_length < 0:
+            self._send_json(400, error_response_body("Invalid Content-Length header"),
+                            close_connection=True)
+            return
+        if content_length > MAX_REQUEST_BODY_SIZE:
+            self._send_json(413, error_response_body("Request body too large"),
+                            close_connection=True)
+            return
+
+        try:
+            request_data = orjson.loads(self._read_body(content_length))
+        except orjson.JSONDecodeError as e:
+            self._send_json(400, error_response_body(f"Invalid JSON: {str(e)}"))
+            return
+
+        print(f"📥 Received prediction request")
+
+        try:
+            # Process the prediction
+            body = prediction_response_body(request_data)
+            status = 200
+        except Exception as e:
+            body = error_response_body(f"Server error: {str(e)}")
+            status = 500
+
+        # Send response
+        self._send_json(status, body)
+
+    def _send_json(self, status, body, close_connection=False):
+        """Send a complete JSON response with an explicit Content-Length"""
+        self.send_response(status)
         self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
         self.send_header('Access-Control-Allow-Origin', '*')
+        if close_connection:
+            # send_header also sets self.close_connection for this value
+            self.send_header('Connection', 'close')
         self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self, content_length):
+        """Read the request body into a preallocated buffer without extra copies"""
+        buffer = bytearray(content_length)
+        view = memoryview(buffer)
+        received = 0
+        while received < content_length:
+            count = self.rfile.readinto(view[received:])
+            if not count:
+                break
+            received += count
+        # orjson parses the buffer directly, no bytes/str conversion needed
+        return view[:received]
+
+def _validate_prediction_request(data, timestamp):
+    """
+    Extract and validate prediction parameters
+
+    Args:
+        data: Dictionary containing prediction parameters
+        timestamp: Request time reported in error responses
+
+    Returns:
+        Tuple of (parameters, error); parameters is a dictionary of
+        generate_predictions arguments, error is an error response or None
+    """
+    # Extract and validate parameters
+    parameters = {name: (data.get(name) or "").strip() for name in REQUIRED_FIELDS}
+    horizon_window = data.get("horizon_window", 1)
+    response_format = data.get("response_format", "records")
+
+    # Validate required parameters
+    missing_params = [name for name, value in parameters.items() if not value]
 
-        health_info = {
-            "status": "healthy",
-            "service": "MPI Price Predictor API",
-            "version": "1.0.0",
-            "model_loaded": MODEL_LOADED,
-            "timestamp": datetime.now().isoformat(),
-            "endpoints": {
-                "GET /": "Health check and API information",
-                "POST /": "Make price predictions",
-                "OPTIONS /": "CORS preflight"
-            },
-            "usage": {
-                "method": "POST",
-                "content_type": "application/json",
-                "required_fields": [
-                    "product_type", 
-                    "tg_code", 
-                    "country_region", 
-                    "country", 
-                    "industry"
-                ],
-                "optional_fields": {
-                    "horizon_window": "Number of months to predict (default: 1)"
-                }
+    if missing_params:
+        return None, {
+            "success": False,
+            "error": f"Missing required parameters: {', '.join(missing_params)}",
+            "timestamp": timestamp
+        }
+
+    # Validate horizon_window
+    try:
+        horizon_window = int(horizon_window)
+        if horizon_window < 1 or horizon_window > MAX_HORIZON_WINDOW:
+            return None, {
+                "success": False,
+                "error": f"horizon_window must be between 1 and {MAX_HORIZON_WINDOW} months",
+                "timestamp": timestamp
             }
+    except (ValueError, TypeError):
+        return None, {
+            "success": False,
+            "error": "horizon_window must be a valid integer",
+            "timestamp": timestamp
         }
 
-        response = json.dumps(health_info, indent=2)
-        self.wfile.write(response.encode('utf-8'))
+    # Validate response_format
+    if response_format not in RESPONSE_FORMATS:
+        return None, {
+            "success": False,
+            "error": f"response_format must be one of: {', '.join(RESPONSE_FORMATS)}",
+            "timestamp": timestamp
+        }
 
-    def do_POST(self):
-        """Handle price prediction requests"""
-        try:
-            # Set CORS headers
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
+    parameters["horizon_window"] = horizon_window
+    parameters["response_format"] = response_format
+    return parameters, None
 
-            # Read and parse request data
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            request_data = json.loads(post_data)
+def _processing_error(e, timestamp):
+    """Error response for an unexpected failure while processing a request"""
+    return {
+        "success": False,
+        "error": f"Prediction processing error: {str(e)}",
+        "timestamp": timestamp
+    }
 
-            print(f"📥 Received prediction request")
+def process_prediction_request(data):
+    """
+    Process prediction request and return results
 
-            # Process the prediction
-            result = self.process_prediction_request(request_data)
+    Args:
+        data: Dictionary containing prediction parameters
 
-            # Send response
-            response = json.dumps(result, indent=2)
-            self.wfile.write(response.encode('utf-8'))
+    Returns:
+        Dictionary with prediction results or error information
+    """
+    timestamp = datetime.now()
+    try:
+        parameters, error = _validate_prediction_request(data, timestamp)
+        if error:
+            return error
 
-        except json.JSONDecodeError as e:
-            self.send_error(400, f"Invalid JSON: {str(e)}")
-        except Exception as e:
-            error_response = {
-                "success": False,
-                "error": f"Server error: {str(e)}",
-                "timestamp": datetime.now().isoformat()
-            }
-            self.wfile.write(json.dumps(error_response).encode('utf-8'))
-
-    def process_prediction_request(self, data):
-        """
-        Process prediction request and return results
-        
-        Args:
-            data: Dictionary containing prediction parameters
-            
-        Returns:
-            Dictionary with prediction results or error information
-        """
-        try:
-            # Extract and validate parameters
-            product_type = data.get("product_type", "").strip()
-            tg_code = data.get("tg_code", "").strip()
-            country_region = data.get("country_region", "").strip()
-            country = data.get("country", "").strip()
-            industry = data.get("industry", "").strip()
-            horizon_window = data.get("horizon_window", 1)
-
-            # Validate required parameters
-            missing_params = []
-            if not product_type:
-                missing_params.append("product_type")
-            if not tg_code:
-                missing_params.append("tg_code")
-            if not country_region:
-                missing_params.append("country_region")
-            if not country:
-                missing_params.append("country")
-            if not industry:
-                missing_params.append("industry")
-
-            if missing_params:
-                return {
-                    "success": False,
-                    "error": f"Missing required parameters: {', '.join(missing_params)}",
-                    "timestamp": datetime.now().isoformat()
-                }
-
-            # Validate horizon_window
-            try:
-                horizon_window = int(horizon_window)
-                if horizon_window < 1 or horizon_window > 24:
-                    return {
-                        "success": False,
-                        "error": "horizon_window must be between 1 and 24 months",
-                        "timestamp": datetime.now().isoformat()
-                    }
-            except (ValueError, TypeError):
-                return {
-                    "success": False,
-                    "error": "horizon_window must be a valid integer",
-                    "timestamp": datetime.now().isoformat()
-                }
-
-            # Generate predictions
-            predictions = self.generate_predictions(
-                product_type, tg_code, country_region, country, 
-                industry, horizon_window
-            )
-
-            return predictions
+        # Generate predictions
+        return generate_predictions(**parameters, timestamp=timestamp)
 
-        except Exception as e:
-            return {
-                "success": False,
-                "error": f"Prediction processing error: {str(e)}",
-                "timestamp": datetime.now().isoformat()
-            }
+    except Exception as e:
+        return _processing_error(e, timestamp)
 
-    def generate_predictions(self, product_type, tg_code, country_region, 
-                           country, industry, horizon_window):
-        """
-        Generate price predictions using the model or simulation
-        
-        Args:
-            product_type: Type of product
-            tg_code: TG product code
-            country_region: Geographic region
-            country: Country name
-            industry: Industry sector
-            horizon_window: Number of months to predict
-            
-        Returns:
-            Dictionary with prediction results
-        """
-        base_price = 20.0  # Base price for simulation
-        predictions = []
-
-        # Generate predictions for each month in the horizon
-        for month_offset in range(horizon_window):
-            # Calculate year and month
-            year = 2024
-            month = (month_offset % 12) + 1
-            year += month_offset // 12
-
-            # Generate prediction
-            if MODEL_LOADED:
-                # Use actual model prediction
-                try:
-                    predicted_price = predict_single_item(
-                        product_type=product_type,
-                        tg_code=tg_code,
-                        country_region=country_region,
-                        country=country,
-                        industry=industry,
-                        year=year,
-                        month=month
-                    )
-                    price_value = float(predicted_price) if predicted_price else None
-                except Exception as e:
-                    price_value = None
-                    print(f"⚠️ Model prediction error: {e}")
-            else:
-                # Use simulated prediction (linear increase)
-                price_value = round(base_price + (month_offset * 0.5), 2)
-
-            # Create prediction object
-            prediction = {
-                "period": month_offset + 1,
-                "year": year,
-                "month": month,
-                "date": f"{year}-{month:02d}",
-                "predicted_price": price_value,
-                "currency": "USD"
-            }
+async def process_prediction_request_async(data):
+    """
+    Async variant of process_prediction_request for the ASGI app
 
-            # Add error information if prediction failed
-            if price_value is None:
-                prediction["error"] = "Prediction failed for this period"
-            
-            predictions.append(prediction)
-
-        # Calculate statistics from successful predictions
-        successful_predictions = [p for p in predictions if p.get("predicted_price") is not None]
-        
-        if successful_predictions:
-            prices = [p["predicted_price"] for p in successful_predictions]
-            statistics = {
-                "min_price": min(prices),
-                "max_price": max(prices),
-                "avg_price": round(sum(prices) / len(prices), 2),
-                "price_trend": "increasing" if len(prices) > 1 and prices[-1] > prices[0] 
-                              else "decreasing" if len(prices) > 1 and prices[-1] < prices[0] 
-                              else "stable"
-            }
-        else:
-            statistics = {
-                "min_price": None,
-                "max_price": None,
-                "avg_price": None,
-                "price_trend": "unknown"
-            }
+    Only price prediction differs (see _predict_prices_async); validation,
+    error handling and the _build_prediction_response step of
+    generate_predictions are shared with the sync path.
+    """
+    timestamp = datetime.now()
+    try:
+        parameters, error = _validate_prediction_request(data, timestamp)
+        if error:
+            return error
+
+        # Generate predictions
+        prices = await _predict_prices_async(parameters)
+        return _build_prediction_response(parameters, prices, timestamp)
+
+    except Exception as e:
+        return _processing_error(e, timestamp)
+
+def _response_cache_key(data):
+    """Response cache key for a raw prediction request, or None if uncacheable"""
+    if not isinstance(data, dict):
+        return None
+    key = tuple(data.get(name) for name in REQUIRED_FIELDS) + (
+        data.get("horizon_window", 1),
+        data.get("response_format", "records"),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+def _get_cached_response(data):
+    """Return (cache key, cached response body or None) for a raw request"""
+    key = _response_cache_key(data)
+    if key is None:
+        return None, None
+    with _RESPONSE_CACHE_LOCK:
+        return key, _RESPONSE_CACHE.get(key)
+
+def _serialize_response(key, result):
+    """Serialize a prediction result, caching it if every period succeeded"""
+    body = orjson.dumps(result, option=JSON_OPTIONS)
+    if key is not None and result.get("success") and not result.get("failed_predictions"):
+        with _RESPONSE_CACHE_LOCK:
+            _RESPONSE_CACHE[key] = body
+    return body
+
+def prediction_response_body(data):
+    """
+    Process a prediction request and return the serialized response body
+
+    Identical requests within RESPONSE_CACHE_TTL seconds reuse the earlier
+    response bytes, skipping both prediction and serialization.
+    """
+    key, body = _get_cached_response(data)
+    if body is None:
+        body = _serialize_response(key, process_prediction_request(data))
+    return body
+
+async def prediction_response_body_async(data):
+    """Async variant of prediction_response_body for the ASGI app"""
+    key, body = _get_cached_response(data)
+    if body is None:
+        body = _serialize_response(key, await process_prediction_request_async(data))
+    return body
+
+def _prediction_periods(horizon_window):
+    """Offsets, years and months of each period in the horizon (read-only)"""
+    return (_PERIOD_OFFSETS[:horizon_window], _PERIOD_YEARS[:horizon_window],
+            _PERIOD_MONTHS[:horizon_window])
+
+def _simulated_prices(offsets):
+    """Simulated prediction (linear increase from the base price)"""
+    base_price = 20.0  # Base price for simulation
+    return np.round(base_price + offsets * 0.5, 2)
 
-        # Prepare final response
-        response = {
-            "success": True,
-            "model_used": "tensorflow" if MODEL_LOADED else "simulation",
-            "horizon_window": horizon_window,
-            "total_predictions": len(predictions),
-            "successful_predictions": len(successful_predictions),
-            "failed_predictions": len(predictions) - len(successful_predictions),
-            "input_parameters": {
-                "product_type": product_type,
-                "tg_code": tg_code,
-                "country_region": country_region,
-                "country": country,
-                "industry": industry
-            },
-            "price_statistics": statistics,
-            "predictions": predictions,
-            "timestamp": datetime.now().isoformat()
+def _model_inputs(parameters):
+    """The model's input fields, in predict_single_item/predict_batch order"""
+    return {name: parameters[name] for name in REQUIRED_FIELDS}
+
+def _predict_batch_prices(inputs, years, months):
+    """Run a single predict_batch call, returning NaN for failed periods"""
+    try:
+        prices = np.array(predict_batch(*inputs.values(), years, months),
+                          dtype=np.float64)
+        if prices.shape != (len(years),):
+            raise ValueError(f"expected {len(years)} predictions, got shape {prices.shape}")
+    except Exception as e:
+        print(f"⚠️ Model batch prediction error: {e}")
+        return np.full(len(years), np.nan)
+
+    # Same rule as the per-period path: an empty (zero) prediction is a failure
+    prices[prices == 0] = np.nan
+    return prices
+
+def _predict_period_price(inputs, year, month):
+    """Run (cached) model inference for one period, returning NaN on failure"""
+    try:
+        return _predict_cached(**inputs, year=year, month=month)
+    except Exception as e:
+        print(f"⚠️ Model prediction error: {e}")
+        return np.nan
+
+def _predict_prices(parameters):
+    """
+    Predict the price of every period, returning NaN for failed periods
+
+    Uses the simulation when no model is loaded, otherwise a single
+    predict_batch call when the model provides it, falling back to one
+    (cached) predict_single_item call per period.
+    """
+    offsets, years, months = _prediction_periods(parameters["horizon_window"])
+    if not MODEL_LOADED:
+        return _simulated_prices(offsets)
+
+    inputs = _model_inputs(parameters)
+    if predict_batch is not None:
+        return _predict_batch_prices(inputs, years, months)
+
+    return np.array([
+        _predict_period_price(inputs, year, month)
+        for year, month in zip(years.tolist(), months.tolist())
+    ], dtype=np.float64)
+
+async def _predict_prices_async(parameters):
+    """
+    Async variant of _predict_prices
+
+    Without predict_batch, the per-period model calls run concurrently in
+    worker threads instead of one after another; every other case defers
+    to _predict_prices.
+    """
+    if not MODEL_LOADED:
+        return _predict_prices(parameters)
+    if predict_batch is not None:
+        return await asyncio.to_thread(_predict_prices, parameters)
+
+    inputs = _model_inputs(parameters)
+    _, years, months = _prediction_periods(parameters["horizon_window"])
+    prices = await asyncio.gather(*(
+        asyncio.to_thread(_predict_period_price, inputs, year, month)
+        for year, month in zip(years.tolist(), months.tolist())
+    ))
+    return np.array(prices, dtype=np.float64)
+
+def _prediction_records(horizon_window, prices, failed):
+    """Build the per-period prediction objects"""
+    predictions = []
+    for (period, year, month, date), price, is_failed in zip(
+            _PERIOD_FIELDS[:horizon_window], prices.tolist(), failed.tolist()):
+        prediction = {
+            "period": period,
+            "year": year,
+            "month": month,
+            "date": date,
+            "predicted_price": None if is_failed else price,
+            "currency": "USD"
         }
 
-        # Add note if using simulation
-        if not MODEL_LOADED:
-            response["note"] = "Using simulated data. Deploy with model files for real predictions."
+        # Add error information if prediction failed
+        if is_failed:
+            prediction["error"] = "Prediction failed for this period"
+
+        predictions.append(prediction)
+    return predictions
+
+def generate_predictions(product_type, tg_code, country_region,
+                         country, industry, horizon_window,
+                         response_format="records", timestamp=None):
+    """
+    Generate price predictions using the model or simulation
+
+    Args:
+        product_type: Type of product
+        tg_code: TG product code
+        country_region: Geographic region
+        country: Country name
+        industry: Industry sector
+        horizon_window: Number of months to predict
+        response_format: "records" for a list of per-period objects,
+            "columnar" for one array per field
+        timestamp: Request time to report (default: now)
 
-        return response
+    Returns:
+        Dictionary with prediction results
+    """
+    parameters = {
+        "product_type": product_type,
+        "tg_code": tg_code,
+        "country_region": country_region,
+        "country": country,
+        "industry": industry,
+        "horizon_window": horizon_window,
+        "response_format": response_format
+    }
+    return _build_prediction_response(
+        parameters, _predict_prices(parameters), timestamp or datetime.now()
+    )
+
+def _build_prediction_response(parameters, prices, timestamp):
+    """Assemble the prediction response from the per-period prices"""
+    horizon_window = parameters["horizon_window"]
+    failed = np.isnan(prices)
+
+    if parameters["response_format"] == "columnar":
+        # One array per field; orjson serializes the NumPy arrays natively
+        # and writes failed (NaN) prices as null
+        predictions = {
+            "period": _PERIOD_NUMBERS[:horizon_window],
+            "year": _PERIOD_YEARS[:horizon_window],
+            "month": _PERIOD_MONTHS[:horizon_window],
+            "date": _PERIOD_DATES[:horizon_window],
+            "predicted_price": prices,
+            "currency": "USD"
+        }
+    else:
+        predictions = _prediction_records(horizon_window, prices, failed)
+
+    # Calculate statistics from successful predictions
+    successful_prices = prices[~failed]
+
+    if successful_prices.size:
+        statistics = {
+            "min_price": float(successful_prices.min()),
+            "max_price": float(successful_prices.max()),
+            "avg_price": round(float(successful_prices.mean()), 2),
+            "price_trend": _PRICE_TRENDS[int(np.sign(successful_prices[-1] - successful_prices[0])) + 1]
+        }
+    else:
+        statistics = {
+            "min_price": None,
+            "max_price": None,
+            "avg_price": None,
+            "price_trend": "unknown"
+        }
+
+    # Prepare final response from the fixed-shape template
+    response = _RESPONSE_TEMPLATE.copy()
+    response.update(
+        horizon_window=horizon_window,
+        total_predictions=horizon_window,
+        successful_predictions=int(successful_prices.size),
+        failed_predictions=int(failed.sum()),
+        input_parameters=_model_inputs(parameters),
+        price_statistics=statistics,
+        predictions=predictions,
+        timestamp=timestamp
+    )
+
+    return response
+
+async def _read_asgi_body(receive):
+    """Collect the full ASGI request body, or None if it exceeds MAX_REQUEST_BODY_SIZE"""
+    chunks = []
+    received = 0
+    more_body = True
+    while more_body:
+        message = await receive()
+        chunk = message.get("body", b"")
+        received += len(chunk)
+        if received > MAX_REQUEST_BODY_SIZE:
+            return None
+        chunks.append(chunk)
+        more_body = message.get("more_body", False)
+    return b"".join(chunks)
+
+async def _send_response(send, status, body=b"", content_type=None):
+    """Send a complete ASGI HTTP response with CORS headers"""
+    headers = [(name.lower().encode(), value.encode())
+               for name, value in CORS_HEADERS.items()]
+    if content_type:
+        headers.append((b"content-type", content_type.encode()))
+    headers.append((b"content-length", str(len(body)).encode()))
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+async def _lifespan(receive, send):
+    """Acknowledge ASGI lifespan startup/shutdown events"""
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+async def app(scope, receive, send):
+    """
+    ASGI entry point for long-lived deployments
+
+    Run with:
+        uvicorn api.predict:app --loop uvloop --http httptools --workers N
+    """
+    if scope["type"] == "lifespan":
+        await _lifespan(receive, send)
+        return
+    if scope["type"] != "http":
+        return
+
+    method = scope["method"]
+    if method == "OPTIONS":
+        await _send_response(send, 200)
+    elif method == "GET":
+        body = health_response_body()
+        await _send_response(send, 200, body, "application/json")
+    elif method == "POST":
+        body = await _read_asgi_body(receive)
+        if body is None:
+            await _send_response(send, 413, error_response_body("Request body too large"),
+                                 "application/json")
+            return
+
+        try:
+            request_data = orjson.loads(body)
+        except orjson.JSONDecodeError as e:
+            await _send_response(send, 400, error_response_body(f"Invalid JSON: {str(e)}"),
+                                 "application/json")
+            return
+
+        print(f"📥 Received prediction request")
+
+        try:
+            # Process the prediction
+            body = await prediction_response_body_async(request_data)
+            status = 200
+        except Exception as e:
+            body = error_response_body(f"Server error: {str(e)}")
+            status = 500
+
+        await _send_response(send, status, body, "application/json")
+    else:
+        await _send_response(send, 405)
+
+def serve_asgi(host='localhost', port=3000):
+    """Long-lived server: the ASGI app on uvicorn's httptools parser and uvloop"""
+    import uvicorn
+    uvicorn.run(app, host=host, port=port, loop="uvloop", http="httptools")
 
 def main():
-    """Local development server - for testing only"""
-    from http.server import HTTPServer
-    server = HTTPServer(('localhost', 3000), Handler)
+    """
+    Local development server - for testing only
+
+    Pass --asgi to serve the ASGI app through uvicorn (httptools + uvloop)
+    instead of the stdlib HTTP server.
+    """
     print("🚀 Development server running at http://localhost:3000")
     print("📡 Endpoints:")
     print("   GET  / - Health check and API info")
     print("   POST / - Make predictions")
     print("   Press Ctrl+C to stop the server")
+
+    if "--asgi" in sys.argv[1:]:
+        serve_asgi()
+        return
+
+    from http.server import ThreadingHTTPServer
+    # One thread per request so concurrent predictions can overlap
+    # (daemon threads, so Ctrl+C doesn't wait on open connections)
+    server = ThreadingHTTPServer(('localhost', 3000), Handler)
     server.serve_forever()
 
 if __name__ == "__main__":